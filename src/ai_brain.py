@@ -4,11 +4,12 @@ AI Brain Module - Handles LLM integration and response generation
 CUSTOMIZATION GUIDE:
 1. Update trigger words in should_respond() method (bottom of file)
 2. Adjust max_history if needed (default: 10 messages)
-3. Modify max_tokens in _generate_claude_response() for longer/shorter responses
+3. Modify max_tokens/models in Config.GENERATION_TIERS for longer/shorter responses
 """
 
 import anthropic
 from src.config import Config
+from src.generation_policy import GenerationPolicy
 
 class AIBrain:
 
@@ -18,16 +19,18 @@ class AIBrain:
         self.conversation_history = []
         self.max_history = 10  # Keep last 10 messages for context
         
+        # Picks max_tokens, model and brevity from current chat load
+        self.policy = GenerationPolicy()
+        
         # Initialize Claude client
         if self.provider == 'claude':
             self.client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY)
-            self.model = "claude-sonnet-4-20250514"
         else:
             raise ValueError(f"Unknown AI provider: {self.provider}")
         
         print(f"AI Brain initialized with provider: {self.provider}")
     
-    def generate_response(self, username, message, language='en'):
+    def generate_response(self, username, message, language='en', queue_depth=0):
         """
         Generate a response to a chat message
         
@@ -35,6 +38,7 @@ class AIBrain:
             username: The user who sent the message
             message: The message content
             language: Language code (for future multilingual support)
+            queue_depth: Messages still waiting, used to shorten replies under load
         
         Returns:
             Generated response string
@@ -43,23 +47,31 @@ class AIBrain:
             # Add user message to history
             user_prompt = f"{username}: {message}"
             
-            return self._generate_claude_response(user_prompt)
+            decision = self.policy.decide(queue_depth)
+            print(f"[POLICY] {decision['tier']} (pressure {decision['pressure']}, queue {queue_depth}, "
+                  f"{decision['arrival_rate']}/min) -> {decision['model']}, max_tokens={decision['max_tokens']}")
+            
+            return self._generate_claude_response(user_prompt, decision)
         
         except Exception as e:
             print(f"Error generating response: {e}")
             return "Sorry, my connection is a bit glitchy right now... try again?"
     
-    def _generate_claude_response(self, user_prompt):
-        """Generate response using Claude API"""
+    def _generate_claude_response(self, user_prompt, decision):
+        """Generate response using Claude API with settings from the generation policy"""
         # Build conversation history
         messages = self.conversation_history + [
             {"role": "user", "content": user_prompt}
         ]
         
+        system = Config.PERSONALITY_PROMPT
+        if decision['brevity']:
+            system += f"\n\n    {decision['brevity']}"
+        
         response = self.client.messages.create(
-            model=self.model,
-            max_tokens=300, # limits how long response can be.
-            system=Config.PERSONALITY_PROMPT,
+            model=decision['model'],
+            max_tokens=decision['max_tokens'], # limits how long response can be.
+            system=system,
             messages=messages
         )
         
@@ -5,7 +5,7 @@ This module manages:
 - Connection to Twitch IRC
 - Message queue for sequential processing
 - Commands for moderators
-- Integration with AI brain, TTS, and VTuber controller
+- Integration with AI brain, TTS, VTuber controller and subtitles
 """
 
 from twitchio.ext import commands
@@ -15,6 +15,8 @@ from src.config import Config
 from src.ai_brain import AIBrain
 from src.tts_engine import TTSEngine
 from src.vtuber_controller import VTuberController
+from src.subtitle_server import SubtitleServer
+from src.emotion_engine import EmotionEngine
 
 class MeiBot(commands.Bot):
 
@@ -38,6 +40,12 @@ class MeiBot(commands.Bot):
         
         # Initialize VTuber controller
         self.vtuber = VTuberController()
+        self.emotion_engine = EmotionEngine()
+        self.expression_task = None
+        
+        # Subtitles follow the TTS word events
+        self.subtitles = SubtitleServer()
+        self.tts_engine.add_listener(self.subtitles.on_speech)
         
         # Message queue for handling multiple requests
         self.message_queue = Queue()
@@ -60,6 +68,14 @@ class MeiBot(commands.Bot):
         # Connect to VTube Studio
         print("Connecting to VTube Studio...")
         await self.vtuber.connect()
+        
+        # Start subtitle server for the OBS browser source
+        await self.subtitles.start()
+    
+    async def close(self):
+        """Shut down the subtitle server along with the bot"""
+        await self.subtitles.stop()
+        await super().close()
     
     async def event_channel_joined(self, channel):
         """Called when bot successfully joins a channel"""
@@ -96,6 +112,7 @@ class MeiBot(commands.Bot):
         """Queue message for AI response"""
         # Add message to queue
         self.message_queue.put(message)
+        self.ai_brain.policy.record_arrival()
         print(f"[QUEUE] Added message to queue. Queue size: {self.message_queue.qsize()}")
         
         # Start processing if not already running
@@ -115,7 +132,8 @@ class MeiBot(commands.Bot):
                 # Generate AI response
                 response = self.ai_brain.generate_response(
                     username=message.author.name,
-                    message=message.content
+                    message=message.content,
+                    queue_depth=self.message_queue.qsize()
                 )
                 
                 if len(response) > 450:  # Leave buffer for safety
@@ -150,20 +168,38 @@ class MeiBot(commands.Bot):
                 
                 # Speak response and animate model simultaneously
                 print(f"[TTS] Speaking response...")
-                self.tts_engine.speak(response)
-
-                # Animate VTuber model while speaking
-                print(f"[VTUBER] Animating mouth...")
-                await self.vtuber.simulate_talking(response)
+                chunked = self.tts_engine.enabled and self.tts_engine.chunked
+                if chunked:
+                    # Lip-sync and expressions follow each sentence as it actually starts playing
+                    finished = self.tts_engine.speak(response, on_chunk=self._on_speech_chunk)
+                    
+                    # Wait for the real end of playback, with a timeout in case pyttsx3 hangs
+                    done = await asyncio.get_running_loop().run_in_executor(
+                        None, finished.wait, self.tts_engine.playback_timeout(response)
+                    )
+                    if not done:
+                        print(f"[TTS] Playback timed out, moving on")
+                    
+                    await self.vtuber.set_emotion(None)
+                else:
+                    self.tts_engine.speak(response)
+                    
+                    # Expressions run as a background task so they never delay speech or lip-sync
+                    emotion_tags = self.emotion_engine.tag(response)
+                    self.expression_task = asyncio.create_task(self.vtuber.perform_emotions(emotion_tags))
+                    
+                    # Animate VTuber model while speaking
+                    print(f"[VTUBER] Animating mouth...")
+                    await self.vtuber.simulate_talking(response)
  
-                # Small buffer after speaking
-                await asyncio.sleep(1)
-                
-                # Wait for TTS to finish (estimate based on text length)
-                # Roughly 150 words per minute = 2.5 words per second
-                word_count = len(response.split())
-                tts_duration = (word_count / 2.5) + 1  # +1 second buffer
-                await asyncio.sleep(tts_duration)
+                    # Small buffer after speaking
+                    await asyncio.sleep(1)
+                    
+                    # Wait for TTS to finish (estimate based on text length)
+                    # Roughly 150 words per minute = 2.5 words per second
+                    word_count = len(response.split())
+                    tts_duration = (word_count / 2.5) + 1  # +1 second buffer
+                    await asyncio.sleep(tts_duration)
                 
                 # Cooldown between responses
                 await asyncio.sleep(self.response_cooldown)
@@ -176,6 +212,11 @@ class MeiBot(commands.Bot):
         self.is_processing = False
         print(f"[QUEUE] Queue empty, waiting for new messages")
     
+    def _on_speech_chunk(self, index, sentence, duration):
+        """TTS chunk callback (TTS thread): tag the sentence and hand it to the VTuber controller"""
+        emotion = self.emotion_engine.detect(sentence)
+        self.vtuber.on_speech_chunk(index, sentence, duration, emotion)
+    
     @commands.command(name='mei')
     async def mei_command(self, ctx):
         """Direct command to talk to Mei"""
@@ -209,6 +250,21 @@ class MeiBot(commands.Bot):
         else:
             await ctx.send("Only mods can toggle TTS!")
     
+    @commands.command(name='load')
+    async def load_status(self, ctx):
+        """Show how chat load is shaping responses"""
+        if ctx.author.is_mod or ctx.author.is_broadcaster:
+            metrics = self.ai_brain.policy.get_metrics()
+            last = metrics['last_decision']
+            tier = last['tier'] if last else 'none yet'
+            await ctx.send(
+                f"Queue: {self.message_queue.qsize()} | Rate: {metrics['arrival_rate']}/min | "
+                f"Last tier: {tier} | Tiers used: {metrics['tier_counts']} | "
+                f"Avg max_tokens: {metrics['avg_max_tokens']}"
+            )
+        else:
+            await ctx.send("Only mods can check my load!")
+    
     @commands.command(name='help')
     async def help_command(self, ctx):
         """Show available commands"""
@@ -216,6 +272,7 @@ class MeiBot(commands.Bot):
             "Commands: !meibo [message] - talk to me | "
             "!clear - clear memory (mods) | "
             "!tts - toggle TTS (mods) | "
+            "!load - chat load stats (mods) | "
             "Just mention 'mei' or 'meibo' in chat to talk!"
         )
         await ctx.send(help_text)
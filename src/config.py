@@ -24,11 +24,66 @@ class Config:
     TTS_ENABLED = os.getenv('TTS_ENABLED', 'true').lower() == 'true'
     TTS_RATE = int(os.getenv('TTS_RATE', '150'))
     TTS_VOLUME = float(os.getenv('TTS_VOLUME', '0.9'))
+    TTS_BACKEND = os.getenv('TTS_BACKEND', 'pyttsx3').lower()  # 'pyttsx3' or 'null' (silent, for headless testing)
+    TTS_CHUNKED = os.getenv('TTS_CHUNKED', 'true').lower() == 'true'  # Speak sentence by sentence for faster first audio
+    TTS_BUFFER_CHUNKS = int(os.getenv('TTS_BUFFER_CHUNKS', '2'))  # Sentences synthesized ahead of playback
+    
+    # Subtitle Configuration (OBS browser source)
+    SUBTITLES_ENABLED = os.getenv('SUBTITLES_ENABLED', 'true').lower() == 'true'
+    SUBTITLE_HOST = os.getenv('SUBTITLE_HOST', '127.0.0.1')
+    SUBTITLE_PORT = int(os.getenv('SUBTITLE_PORT', '8765'))
+    SUBTITLE_HOLD = float(os.getenv('SUBTITLE_HOLD', '2.0'))  # Seconds a finished caption stays on screen
+    SUBTITLE_MAX_WORDS = int(os.getenv('SUBTITLE_MAX_WORDS', '16'))  # Longest caption shown at once
+    
+    # Expression Configuration (VTube Studio)
+    EXPRESSIONS_ENABLED = os.getenv('EXPRESSIONS_ENABLED', 'true').lower() == 'true'
+    EXPRESSION_FADE = float(os.getenv('EXPRESSION_FADE', '0.3'))  # Seconds to fade expressions in/out
+    
+    # Detected emotion -> expression or hotkey name on your VTS model (case-insensitive)
+    EMOTION_EXPRESSIONS = {
+        'happy': 'Smile',
+        'excited': 'Excited',
+        'sad': 'Sad',
+        'angry': 'Angry',
+        'scared': 'Scared',
+        'surprised': 'Surprised',
+        'smug': 'Smug',
+    }
     
     # Bot Behavior
     RESPONSE_COOLDOWN = int(os.getenv('RESPONSE_COOLDOWN', '3'))
     MAX_MESSAGE_LENGTH = int(os.getenv('MAX_MESSAGE_LENGTH', '500'))
     
+    # Load-aware generation (shorter, cheaper replies when chat is busy)
+    LOAD_WINDOW = int(os.getenv('LOAD_WINDOW', '60'))  # Seconds of arrivals used for the message rate
+    LOAD_QUEUE_HIGH = int(os.getenv('LOAD_QUEUE_HIGH', '10'))  # Queue depth treated as full pressure
+    LOAD_RATE_HIGH = float(os.getenv('LOAD_RATE_HIGH', '20'))  # Triggered messages per minute treated as full pressure
+    
+    # Tiers are picked by pressure (0.0 calm to 1.0 flooded), highest matching min_pressure wins
+    GENERATION_TIERS = [
+        {
+            'name': 'calm',
+            'min_pressure': 0.0,
+            'model': 'claude-sonnet-4-20250514',
+            'max_tokens': 300,
+            'brevity': None,
+        },
+        {
+            'name': 'busy',
+            'min_pressure': 0.3,
+            'model': 'claude-sonnet-4-20250514',
+            'max_tokens': 150,
+            'brevity': "Chat is busy right now: answer in 1-2 short sentences.",
+        },
+        {
+            'name': 'raid',
+            'min_pressure': 0.7,
+            'model': 'claude-haiku-4-5-20251001',
+            'max_tokens': 60,
+            'brevity': "Chat is flooding in: reply with one short, punchy sentence.",
+        },
+    ]
+    
     # Mei's Personality System Prompt
     PERSONALITY_PROMPT = """
  
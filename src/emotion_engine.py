@@ -0,0 +1,107 @@
+"""
+Emotion Engine Module - Tags responses with emotions for facial expressions
+
+This module:
+- Splits responses into sentences
+- Scores each sentence against a small emotion lexicon (no model download)
+- Adds a few punctuation/emoticon rules for tone
+- Returns per-sentence tags for VTuberController to schedule
+
+CUSTOMIZATION GUIDE:
+1. Add words to LEXICON to tune what counts as each emotion
+2. Map emotions to your model's expressions in Config.EMOTION_EXPRESSIONS
+"""
+
+import re
+from src.text_utils import split_sentences
+
+# Emotion -> words that hint at it. Matched on whole lowercase words.
+# Keep everyday words (what, really, yes...) out, or most questions would change the face.
+LEXICON = {
+    'happy': {
+        'happy', 'glad', 'love', 'loved', 'lovely', 'yay', 'cute', 'sweet', 'delicious',
+        'snack', 'snacks', 'pastry', 'pastries', 'cat', 'cats', 'hehe', 'haha', 'lol',
+    },
+    'excited': {
+        'wow', 'amazing', 'awesome', 'shiny', 'sparkly', 'treasure', 'incredible',
+        'excited', 'exciting', 'ooh', 'epic', 'hype',
+    },
+    'sad': {
+        'sad', 'sorry', 'lonely', 'unfortunately', 'cry', 'crying', 'tears',
+        'sigh', 'alone', 'hurts', 'depressing',
+    },
+    'angry': {
+        'angry', 'mad', 'annoying', 'annoyed', 'hate', 'rude', 'stupid', 'ugh',
+        'grr', 'furious', 'dare', 'insolent', 'mortal', 'mortals',
+    },
+    'scared': {
+        'scary', 'scared', 'afraid', 'ghost', 'ghosts', 'horror', 'creepy', 'spooky',
+        'terrifying', 'nope', 'eek', 'cursed',
+    },
+    'surprised': {
+        'huh', 'whoa', 'suddenly', 'unexpected', 'unbelievable', 'shocked', 'gasp',
+    },
+    'smug': {
+        'obviously', 'deity', 'worship', 'powerful', 'mighty',
+        'mysterious', 'behold', 'legendary', 'fufu', 'heh',
+    },
+}
+
+# Emoticons and punctuation that nudge the score
+RULES = [
+    (re.compile(r'[:;]-?[)D]|\^\^|<3'), 'happy', 2),
+    (re.compile(r':-?\(|T_T|;_;'), 'sad', 2),
+    (re.compile(r'\?!|!\?'), 'surprised', 2),
+    (re.compile(r'!{2,}'), 'excited', 1),
+]
+
+WORD_PATTERN = re.compile(r"[a-z']+")
+
+class EmotionEngine:
+    """Fast rule-based emotion tagger"""
+
+    def __init__(self, lexicon=None, rules=None):
+        self.rules = RULES if rules is None else rules
+
+        # Invert the lexicon once so each word is a single dict lookup
+        self.word_emotions = {}
+        for emotion, words in (LEXICON if lexicon is None else lexicon).items():
+            for word in words:
+                self.word_emotions.setdefault(word, []).append(emotion)
+
+    def detect(self, text):
+        """
+        Detect the strongest emotion in a piece of text
+
+        Args:
+            text: Sentence or short passage
+
+        Returns:
+            Emotion name, or None if nothing stands out (neutral)
+        """
+        scores = {}
+
+        for word in WORD_PATTERN.findall(text.lower()):
+            for emotion in self.word_emotions.get(word, ()):
+                scores[emotion] = scores.get(emotion, 0) + 1
+
+        for pattern, emotion, weight in self.rules:
+            if pattern.search(text):
+                scores[emotion] = scores.get(emotion, 0) + weight
+
+        if not scores:
+            return None
+
+        return max(scores, key=scores.get)
+
+    def tag(self, text):
+        """
+        Tag each sentence of a response with an emotion
+
+        Args:
+            text: Full AI response
+
+        Returns:
+            List of (sentence, emotion) tuples, emotion may be None
+        """
+        return [(sentence, self.detect(sentence)) for sentence in split_sentences(text)]
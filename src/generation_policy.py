@@ -0,0 +1,102 @@
+"""
+Generation Policy Module - Adapts response length and model to chat load
+
+This module:
+- Tracks how fast triggered messages arrive (sliding window)
+- Combines arrival rate and queue depth into a pressure score
+- Picks a tier from Config.GENERATION_TIERS (max_tokens, model, brevity instruction)
+- Keeps metrics about its decisions for the !load command and benchmarks
+
+CUSTOMIZATION GUIDE:
+1. Edit Config.GENERATION_TIERS to change models, token limits or wording
+2. Tune LOAD_QUEUE_HIGH / LOAD_RATE_HIGH for how big your chat usually gets
+"""
+
+import time
+from collections import deque
+from src.config import Config
+
+class GenerationPolicy:
+    """Chooses generation settings based on queue pressure"""
+
+    def __init__(self, tiers=None):
+        self.tiers = sorted(tiers or Config.GENERATION_TIERS, key=lambda tier: tier['min_pressure'])
+        self.window = Config.LOAD_WINDOW
+        self.queue_high = Config.LOAD_QUEUE_HIGH
+        self.rate_high = Config.LOAD_RATE_HIGH
+        self.arrivals = deque()  # Timestamps of recent triggered messages
+
+        self.metrics = {
+            'decisions': 0,
+            'tier_counts': {tier['name']: 0 for tier in self.tiers},
+            'max_tokens_total': 0,
+            'last_decision': None,
+        }
+
+    def record_arrival(self, now=None):
+        """Record a triggered message (call when it is queued)"""
+        now = time.monotonic() if now is None else now
+        self.arrivals.append(now)
+        self._trim(now)
+
+    def arrival_rate(self, now=None):
+        """Triggered messages per minute over the sliding window"""
+        now = time.monotonic() if now is None else now
+        self._trim(now)
+        return len(self.arrivals) * 60 / self.window
+
+    def _trim(self, now):
+        while self.arrivals and self.arrivals[0] < now - self.window:
+            self.arrivals.popleft()
+
+    def decide(self, queue_depth, now=None):
+        """
+        Pick generation settings for the next response
+
+        Args:
+            queue_depth: Messages still waiting behind this one
+            now: Timestamp override (used by the benchmark's simulated clock)
+
+        Returns:
+            Dict with tier, model, max_tokens, brevity, pressure, queue_depth, arrival_rate
+        """
+        rate = self.arrival_rate(now)
+        pressure = min(1.0, max(queue_depth / self.queue_high, rate / self.rate_high))
+
+        tier = self.tiers[0]
+        for candidate in self.tiers:
+            if pressure >= candidate['min_pressure']:
+                tier = candidate
+
+        decision = {
+            'tier': tier['name'],
+            'model': tier['model'],
+            'max_tokens': tier['max_tokens'],
+            'brevity': tier['brevity'],
+            'pressure': round(pressure, 2),
+            'queue_depth': queue_depth,
+            'arrival_rate': round(rate, 1),
+        }
+
+        self.metrics['decisions'] += 1
+        self.metrics['tier_counts'][tier['name']] += 1
+        self.metrics['max_tokens_total'] += tier['max_tokens']
+        self.metrics['last_decision'] = decision
+
+        return decision
+
+    def get_metrics(self, now=None):
+        """
+        Snapshot of the policy's decisions so far
+
+        Args:
+            now: Timestamp override, must use the same clock as record_arrival()
+        """
+        decisions = self.metrics['decisions']
+        return {
+            'decisions': decisions,
+            'tier_counts': dict(self.metrics['tier_counts']),
+            'avg_max_tokens': round(self.metrics['max_tokens_total'] / decisions, 1) if decisions else 0,
+            'arrival_rate': round(self.arrival_rate(now), 1),
+            'last_decision': self.metrics['last_decision'],
+        }
@@ -0,0 +1,235 @@
+"""
+Subtitle Server Module - Streams live captions to an OBS browser source
+
+This module:
+- Serves a small caption page at http://SUBTITLE_HOST:SUBTITLE_PORT/
+- Pushes word-by-word updates over a WebSocket (/ws), no polling
+- Listens to TTSEngine word events so captions follow the audio
+- Sends tiny deltas (one word per message) to keep latency low
+
+OBS setup: add a Browser Source pointing at the page URL, transparent background is built in.
+
+OPTIONAL: Bot works without subtitles. Disable with SUBTITLES_ENABLED=false
+"""
+
+import asyncio
+import json
+from aiohttp import web, WSMsgType
+from src.config import Config
+
+OUTBOX_LIMIT = 256  # Pending updates per browser source before it is dropped
+
+SUBTITLE_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Mei Subtitles</title>
+<style>
+  html, body { margin: 0; background: transparent; overflow: hidden; }
+  #caption {
+    position: absolute; left: 5%; right: 5%; bottom: 40px;
+    text-align: center; font: bold 42px sans-serif; color: #fff;
+    text-shadow: 0 0 6px #000, 2px 2px 2px #000;
+  }
+</style>
+</head>
+<body>
+<div id="caption"></div>
+<script>
+  const caption = document.getElementById("caption");
+  const hold = HOLD_MS;
+  const maxWords = MAX_WORDS;
+  let current = null;
+  let clearTimer = null;
+  let words = [];
+  let sentenceDone = false;
+
+  // Only the current sentence is shown, capped so long sentences can't fill the scene
+  function render() {
+    caption.textContent = words.join(" ");
+  }
+
+  function show(id, snapshot) {
+    clearTimeout(clearTimer);
+    current = id;
+    words = snapshot.slice(-maxWords);
+    sentenceDone = false;
+    render();
+  }
+
+  function addWord(word) {
+    if (sentenceDone) {
+      words = [];
+      sentenceDone = false;
+    }
+    words.push(word);
+    if (words.length > maxWords) {
+      words.shift();
+    }
+    sentenceDone = /[.!?]$/.test(word);
+    render();
+  }
+
+  function connect() {
+    const ws = new WebSocket("ws://" + location.host + "/ws");
+    ws.onmessage = (event) => {
+      const msg = JSON.parse(event.data);
+      if (msg.type === "start") {
+        show(msg.id, msg.words || []);
+      } else if (msg.type === "word" && msg.id === current) {
+        addWord(msg.word);
+      } else if (msg.type === "end" && msg.id === current) {
+        clearTimer = setTimeout(() => { words = []; render(); }, hold);
+      }
+    };
+    ws.onclose = () => setTimeout(connect, 1000);
+  }
+
+  connect();
+</script>
+</body>
+</html>
+"""
+
+class SubtitleServer:
+    """Serves the caption page and broadcasts word updates to connected browser sources"""
+
+    def __init__(self):
+        self.enabled = Config.SUBTITLES_ENABLED
+        self.host = Config.SUBTITLE_HOST
+        self.port = Config.SUBTITLE_PORT
+        self.hold = Config.SUBTITLE_HOLD
+        self.max_words = Config.SUBTITLE_MAX_WORDS
+        self.clients = {}  # WebSocket -> outgoing message queue
+        self.loop = None
+        self.runner = None
+
+        # Current sentence, replayed to clients that connect mid-sentence
+        self.caption_id = 0
+        self.words = []
+        self.speaking = False
+
+    async def start(self):
+        """Start the HTTP/WebSocket server on the running event loop"""
+        if not self.enabled:
+            print("Subtitles are disabled")
+            return False
+
+        if self.runner:
+            return True  # Already running (event_ready fires again on reconnect)
+
+        try:
+            self.loop = asyncio.get_running_loop()
+
+            app = web.Application()
+            app.router.add_get('/', self._handle_page)
+            app.router.add_get('/ws', self._handle_websocket)
+
+            self.runner = web.AppRunner(app, access_log=None)
+            await self.runner.setup()
+            await web.TCPSite(self.runner, self.host, self.port).start()
+
+            print(f"✓ Subtitles available at http://{self.host}:{self.port}/")
+            return True
+
+        except Exception as e:
+            print(f"Failed to start subtitle server: {e}")
+            self.enabled = False
+            return False
+
+    async def stop(self):
+        """Close client connections and shut the server down"""
+        for ws in list(self.clients):
+            await ws.close()
+
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def _handle_page(self, request):
+        page = SUBTITLE_PAGE.replace("HOLD_MS", str(int(self.hold * 1000)))
+        page = page.replace("MAX_WORDS", str(self.max_words))
+        return web.Response(text=page, content_type='text/html')
+
+    async def _handle_websocket(self, request):
+        # No compression: messages are a few bytes and latency matters more
+        ws = web.WebSocketResponse(compress=False, heartbeat=30)
+        await ws.prepare(request)
+
+        # Each client gets its own outbox so words stay in order and a slow
+        # browser source can't delay the others. Bounded so a stalled one can't grow forever.
+        outbox = asyncio.Queue(maxsize=OUTBOX_LIMIT)
+        self.clients[ws] = outbox
+        writer = asyncio.create_task(self._write_loop(ws, outbox))
+        print(f"[SUBTITLES] Browser source connected ({len(self.clients)} total)")
+
+        if self.speaking:
+            outbox.put_nowait(self._encode('start', words=self.words))
+
+        try:
+            # Clients never send anything meaningful, just wait for them to leave
+            async for msg in ws:
+                if msg.type == WSMsgType.ERROR:
+                    break
+        finally:
+            self.clients.pop(ws, None)
+            writer.cancel()
+            print(f"[SUBTITLES] Browser source disconnected ({len(self.clients)} total)")
+
+        return ws
+
+    async def _write_loop(self, ws, outbox):
+        """Forward queued updates to one client as soon as they arrive"""
+        try:
+            while True:
+                payload = await outbox.get()
+                await ws.send_str(payload)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"[SUBTITLES] Error sending update: {e}")
+            self.clients.pop(ws, None)
+            await ws.close()  # Ends the handler's receive loop instead of waiting for the heartbeat
+
+    def on_speech(self, event, data):
+        """
+        TTSEngine listener - called from the TTS thread
+
+        Args:
+            event: 'start', 'word' or 'end'
+            data: Full text for 'start'/'end', the spoken word for 'word'
+        """
+        if not self.enabled or self.loop is None:
+            return
+
+        self.loop.call_soon_threadsafe(self._apply, event, data)
+
+    def _apply(self, event, data):
+        """Update caption state and broadcast the delta (runs on the event loop)"""
+        if event == 'start':
+            self.caption_id += 1
+            self.words = []
+            self.speaking = True
+            self._broadcast(self._encode('start'))
+        elif event == 'word' and self.speaking:
+            # A new sentence starts after the previous word ended one
+            if self.words and self.words[-1][-1:] in '.!?':
+                self.words = []
+            self.words.append(data)
+            self._broadcast(self._encode('word', word=data))
+        elif event == 'end' and self.speaking:
+            self.speaking = False
+            self._broadcast(self._encode('end'))
+
+    def _encode(self, message_type, **fields):
+        return json.dumps({"type": message_type, "id": self.caption_id, **fields})
+
+    def _broadcast(self, payload):
+        for ws, outbox in list(self.clients.items()):
+            try:
+                outbox.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Browser source stopped reading, drop it (the page reconnects on its own)
+                print("[SUBTITLES] Browser source too slow, disconnecting it")
+                self.clients.pop(ws, None)
+                self.loop.create_task(ws.close())
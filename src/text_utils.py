@@ -0,0 +1,14 @@
+"""
+Text Utilities Module - Small text helpers shared by TTS and the emotion engine
+"""
+
+import re
+
+# Sentence ends at .!? followed by whitespace (or the end of the text), and the next
+# sentence must not start lowercase, so decimals (3.5), links (twitch.tv) and
+# abbreviations like "e.g. this" stay in one piece
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+(?![a-z])')
+
+def split_sentences(text):
+    """Split text into sentences, keeping their ending punctuation"""
+    return [s.strip() for s in SENTENCE_END.split(text) if s.strip()]
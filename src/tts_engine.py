@@ -6,6 +6,9 @@ This module:
 - Runs in separate thread to avoid blocking
 - Automatically selects female voice if available
 - Allows runtime toggling of TTS
+- Reports word boundaries to listeners (used for subtitles)
+- Supports a silent 'null' backend for headless testing
+- Chunked mode: synthesizes the next sentence while the current one plays
 
 Future improvements:
 - Upgrade to ElevenLabs for better voice quality
@@ -14,9 +17,21 @@ Future improvements:
 - Add filters
 """
 
-import pyttsx3
+import os
+import queue
+import tempfile
 import threading
+import time
+import wave
+import pyttsx3
 from src.config import Config
+from src.text_utils import split_sentences
+
+# Chunked playback uses the Windows sound API; other platforms fall back to full-text speech
+try:
+    import winsound
+except ImportError:
+    winsound = None
 
 class TTSEngine:
     """Handles text-to-speech conversion"""
@@ -25,9 +40,22 @@ class TTSEngine:
         self.enabled = Config.TTS_ENABLED
         self.rate = Config.TTS_RATE
         self.volume = Config.TTS_VOLUME
+        self.backend = Config.TTS_BACKEND
         self.voice_id = None
+        self.listeners = []  # Called as listener(event, data) for 'start', 'word' and 'end'
+        self.speech_queue = queue.Queue()  # Responses waiting for the speech worker, in arrival order
+        self.speech_worker = None
+        self.speech_deadline = None  # When the worker's current response should be done by
+        self.chunked = Config.TTS_CHUNKED
+        self.buffer_chunks = Config.TTS_BUFFER_CHUNKS  # Max sentences synthesized ahead of playback
+        
+        if self.chunked and self.backend != 'null' and winsound is None:
+            print("Chunked TTS needs winsound (Windows), speaking full responses instead")
+            self.chunked = False
         
-        if self.enabled:
+        if self.enabled and self.backend == 'null':
+            print("TTS Engine initialized (null backend, no audio)")
+        elif self.enabled:
             try:
                 # Initialize once to find the best voice
                 temp_engine = pyttsx3.init()
@@ -49,41 +77,262 @@ class TTSEngine:
         else:
             print("TTS is disabled")
     
-    def speak(self, text):
+    def speak(self, text, on_chunk=None):
         """
         Convert text to speech
         
         Args:
             text: The text to speak
+            on_chunk: Optional callback (index, sentence, duration) fired from the
+                      TTS thread as each sentence starts playing (chunked mode only)
+        
+        Returns:
+            threading.Event that is set once playback has finished
         """
+        finished = threading.Event()
+        
         if not self.enabled:
-            return
+            finished.set()
+            return finished
         
         try:
-            # Run TTS in a separate thread so it doesn't block
-            thread = threading.Thread(target=self._speak_thread, args=(text,))
-            thread.daemon = True
-            thread.start()
+            # Run TTS in a separate thread so it doesn't block. A single worker
+            # plays queued responses one after another, so they never overlap.
+            if self.speech_worker is None or not self.speech_worker.is_alive():
+                self._start_worker()
+            elif self.speech_deadline and time.monotonic() > self.speech_deadline:
+                # pyttsx3 can hang in runAndWait; don't let it silence every later reply
+                print("TTS worker stuck, starting a new one")
+                self._start_worker()
+            
+            self.speech_queue.put((text, finished, on_chunk))
         except Exception as e:
             print(f"TTS Error: {e}")
+            finished.set()
+        
+        return finished
+    
+    def playback_timeout(self, text):
+        """Generous upper bound (seconds) for speaking text, used to detect hangs"""
+        return len(text.split()) * 60 / self.rate * 2 + 5
     
-    def _speak_thread(self, text):
-        """Internal method to handle TTS in separate thread"""
+    def _start_worker(self):
+        """Start a fresh speech worker, carrying over replies still waiting in the queue"""
+        stale_queue = self.speech_queue
+        self.speech_queue = queue.Queue()
+        while True:
+            try:
+                self.speech_queue.put(stale_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        # A stuck worker is abandoned (daemon thread); it only ever reads its own queue
+        self.speech_deadline = None
+        self.speech_worker = threading.Thread(target=self._speech_loop, args=(self.speech_queue,))
+        self.speech_worker.daemon = True
+        self.speech_worker.start()
+    
+    def _speech_loop(self, speech_queue):
+        """Worker thread: speak queued responses in the order they were queued"""
+        me = threading.current_thread()
+        while True:
+            text, finished, on_chunk = speech_queue.get()
+            if me is self.speech_worker:
+                self.speech_deadline = time.monotonic() + self.playback_timeout(text)
+            try:
+                if self.chunked:
+                    self._speak_chunked(text, on_chunk)
+                elif self.backend == 'null':
+                    self._speak_null(text)
+                else:
+                    self._speak_pyttsx3(text)
+            except Exception as e:
+                print(f"TTS Thread Error: {e}")
+            finally:
+                if me is self.speech_worker:
+                    self.speech_deadline = None
+                finished.set()
+    
+    def _create_engine(self):
+        """Create a NEW pyttsx3 engine configured with the current voice settings"""
+        engine = pyttsx3.init()
+        engine.setProperty('rate', self.rate)
+        engine.setProperty('volume', self.volume)
+        
+        if self.voice_id:
+            engine.setProperty('voice', self.voice_id)
+        
+        return engine
+    
+    def _speak_pyttsx3(self, text):
+        """Speak through a fresh pyttsx3 engine, reporting word boundaries"""
         try:
             # Create a NEW engine instance for each speech
-            engine = pyttsx3.init()
-            engine.setProperty('rate', self.rate)
-            engine.setProperty('volume', self.volume)
+            engine = self._create_engine()
             
-            if self.voice_id:
-                engine.setProperty('voice', self.voice_id)
+            # Forward word boundaries as the audio reaches them
+            def on_word(name, location, length):
+                self._emit('word', text[location:location + length])
             
+            engine.connect('started-word', on_word)
+            
+            self._emit('start', text)
             engine.say(text)
             engine.runAndWait()
             engine.stop()
             del engine  # Clean up
         except Exception as e:
             print(f"TTS Thread Error: {e}")
+        finally:
+            self._emit('end', text)
+    
+    def _speak_chunked(self, text, on_chunk=None):
+        """
+        Play a response sentence by sentence. A worker synthesizes ahead into a
+        bounded queue, so audio starts after the first sentence and each
+        following chunk is ready before the previous one ends.
+        """
+        sentences = split_sentences(text) or [text]
+        chunks = queue.Queue(maxsize=self.buffer_chunks)
+        
+        # Runs on the speech worker, so only one synthesis thread (and one pyttsx3 engine) exists at a time
+        worker = threading.Thread(target=self._synthesize_chunks, args=(sentences, chunks))
+        worker.daemon = True
+        worker.start()
+        
+        self._emit('start', text)
+        index = 0
+        
+        while True:
+            # Bounded wait: a hung synthesis step must not block the speech worker forever
+            try:
+                chunk = chunks.get(timeout=self.playback_timeout(text))
+            except queue.Empty:
+                print("TTS Synthesis timed out, skipping the rest of this response")
+                break
+            
+            if chunk is None:  # Worker is done
+                worker.join(timeout=5)
+                break
+            
+            sentence, duration, path = chunk
+            if on_chunk:
+                try:
+                    on_chunk(index, sentence, duration)
+                except Exception as e:
+                    print(f"TTS Chunk Callback Error: {e}")
+            
+            self._play_chunk(sentence, duration, path)
+            index += 1
+        
+        self._emit('end', text)
+    
+    def _synthesize_chunks(self, sentences, chunks):
+        """Worker: render each sentence and queue it as (sentence, duration, wav_path)"""
+        path = None
+        try:
+            for sentence in sentences:
+                path = None
+                if self.backend != 'null':
+                    fd, path = tempfile.mkstemp(suffix='.wav')
+                    os.close(fd)
+                    
+                    # A NEW engine per sentence, same as _speak_pyttsx3: pyttsx3 can hang
+                    # when runAndWait is called again on the same engine
+                    engine = self._create_engine()
+                    engine.save_to_file(sentence, path)
+                    engine.runAndWait()
+                    engine.stop()
+                    del engine
+                    
+                    with wave.open(path, 'rb') as wav:
+                        duration = wav.getnframes() / wav.getframerate()
+                else:
+                    duration = len(sentence.split()) * 60 / self.rate
+                
+                # Blocks while the buffer is full, keeping synthesis a few sentences ahead at most
+                chunks.put((sentence, duration, path))
+                path = None  # Playback owns the file now
+        except Exception as e:
+            print(f"TTS Synthesis Error: {e}")
+            
+            # Don't leave the half-written chunk behind
+            if path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        finally:
+            chunks.put(None)
+    
+    def _play_chunk(self, sentence, duration, path):
+        """
+        Play one chunk. The WAV gives no word boundaries, so word events are an
+        estimate: the chunk's real length is split by each word's character count.
+        Long words and comma pauses can still drift a little from the audio.
+        """
+        words = sentence.split()
+        
+        # Offset of each word = share of the characters (plus a space) spoken before it
+        weights = [len(word) + 1 for word in words]
+        total = sum(weights) or 1
+        offsets = []
+        spoken = 0
+        for weight in weights:
+            offsets.append(duration * spoken / total)
+            spoken += weight
+        
+        try:
+            if path:
+                winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
+            
+            # Time against the clock (not per-word sleeps) so the next chunk starts right on cue
+            start = time.monotonic()
+            for word, offset in zip(words, offsets):
+                delay = start + offset - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                self._emit('word', word)
+            
+            remaining = start + duration - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+        except Exception as e:
+            print(f"TTS Playback Error: {e}")
+        finally:
+            if path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    
+    def _speak_null(self, text):
+        """Silent backend: paces word events at the configured rate without audio"""
+        seconds_per_word = 60 / self.rate
+        
+        self._emit('start', text)
+        for word in text.split():
+            self._emit('word', word)
+            time.sleep(seconds_per_word)
+        self._emit('end', text)
+    
+    def add_listener(self, listener):
+        """
+        Register a callback for speech events
+        
+        Args:
+            listener: Callable taking (event, data). Runs on the TTS thread,
+                      so it must be quick and thread-safe.
+        """
+        self.listeners.append(listener)
+    
+    def _emit(self, event, data):
+        """Notify listeners without letting one failure stop speech"""
+        for listener in self.listeners:
+            try:
+                listener(event, data)
+            except Exception as e:
+                print(f"TTS Listener Error: {e}")
     
     def set_rate(self, rate):
         """Set speech rate"""
@@ -5,16 +5,18 @@ This module controls:
 - Connection to VTube Studio via WebSocket
 - Lip-sync animation during speech
 - Auto-reconnection if connection drops
-- Future: Facial expressions and emotions
+- Facial expressions driven by EmotionEngine tags
+- Caches the model's hotkeys/expressions once per connection
 
 OPTIONAL: Bot works without VTube Studio. If not connected, it will skip animation. Can be used as chat bot instead of streamer bot
 """
 
 import asyncio
 import pyvts
+from src.config import Config
 
 class VTuberController:
-    """Controls VTube Studio model for lip-sync and expressions(later to be implemented)"""
+    """Controls VTube Studio model for lip-sync and expressions"""
     
     def __init__(self):
         self.vts = None
@@ -23,9 +25,27 @@ class VTuberController:
         self.plugin_developer = "MeiDev"
         self.reconnecting = False
         
+        # One websocket is shared by lip-sync and expressions, so requests take turns
+        self.request_lock = asyncio.Lock()
+        
+        # Held for a whole emotion swap so overlapping changes can't leave an expression stuck on
+        self.emotion_lock = asyncio.Lock()
+        
+        # Fetched once per connection in _load_model_actions()
+        self.hotkeys = {}  # hotkey name (lowercase) -> (hotkeyID, hotkey type)
+        self.expressions = {}  # expression name (lowercase) -> expression file
+        self.active_expression = None
+        self.active_hotkey = None  # Toggle hotkey currently switched on
+        self.current_emotion = None
+        
+        # Event loop the controller runs on, for callbacks coming from the TTS thread
+        self.loop = None
+        self.mouth_task = None  # Lip-sync of the sentence currently playing
+        
     async def connect(self):
         """Connect to VTube Studio"""
         try:
+            self.loop = asyncio.get_running_loop()
             self.vts = pyvts.vts(
                 plugin_info={
                     "plugin_name": self.plugin_name,
@@ -42,6 +62,8 @@ class VTuberController:
             self.connected = True
             self.reconnecting = False
             print("✓ Connected to VTube Studio!")
+            
+            await self._load_model_actions()
             return True
             
         except Exception as e:
@@ -67,6 +89,41 @@ class VTuberController:
         await asyncio.sleep(1)
         await self.connect()
     
+    async def _request(self, message):
+        """
+        Send a request to VTube Studio, one at a time over the shared websocket.
+        Shielded: pyvts sends and then waits for the reply, so a cancelled caller must not
+        stop in between, or the unread reply would be handed to the next request.
+        """
+        return await asyncio.shield(self._locked_request(message))
+    
+    async def _locked_request(self, message):
+        async with self.request_lock:
+            return await self.vts.request(message)
+    
+    async def _load_model_actions(self):
+        """Fetch and cache the current model's hotkeys and expressions"""
+        self.hotkeys = {}
+        self.expressions = {}
+        self.active_expression = None
+        self.active_hotkey = None
+        self.current_emotion = None
+        
+        try:
+            response = await self._request(self.vts.vts_request.requestHotKeyList())
+            for hotkey in response["data"].get("availableHotkeys", []):
+                self.hotkeys[hotkey["name"].lower()] = (hotkey["hotkeyID"], hotkey.get("type"))
+            
+            response = await self._request(
+                self.vts.vts_request.BaseRequest("ExpressionStateRequest", {"details": False})
+            )
+            for expression in response["data"].get("expressions", []):
+                self.expressions[expression["name"].lower()] = expression["file"]
+            
+            print(f"✓ Cached {len(self.hotkeys)} hotkeys and {len(self.expressions)} expressions")
+        except Exception as e:
+            print(f"[VTUBER] Could not load hotkeys/expressions: {e}")
+    
     """Control functions"""
     async def trigger_mouth_open(self, duration=0.5):
         """Open mouth for lip-sync effect"""
@@ -75,7 +132,7 @@ class VTuberController:
         
         try:
             # Trigger mouth open parameter
-            await self.vts.request(
+            await self._request(
                 self.vts.vts_request.requestSetParameterValue(
                     parameter="MouthOpen",
                     value=1.0
@@ -86,7 +143,7 @@ class VTuberController:
             await asyncio.sleep(duration)
             
             # Close mouth
-            await self.vts.request(
+            await self._request(
                 self.vts.vts_request.requestSetParameterValue(
                     parameter="MouthOpen",
                     value=0.0
@@ -110,10 +167,16 @@ class VTuberController:
         word_count = len(text.split())
         duration = word_count / 2.5
         
-        # Animate mouth opening/closing
+        await self.animate_mouth(duration)
+    
+    async def animate_mouth(self, duration):
+        """Open/close the mouth for the given number of seconds"""
         try:
-            intervals = int(duration * 4)  # Open/close 4 times per second
-            for i in range(intervals):
+            # Open/close 4 times per second, stopping at a fixed deadline so slow
+            # VTS round trips can't stretch the animation past the audio
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + duration
+            while loop.time() + 0.25 <= deadline:
                 if not self.connected:
                     print("[VTUBER] Connection lost during animation")
                     break
@@ -126,6 +189,142 @@ class VTuberController:
             self.connected = False
             await self.reconnect()
     
+    def on_speech_chunk(self, index, sentence, duration, emotion=None):
+        """
+        TTSEngine chunk callback - called from the TTS thread as each sentence starts playing
+        
+        Args:
+            index: Position of the sentence in the response
+            sentence: The sentence being spoken
+            duration: Real audio length of the sentence in seconds
+            emotion: Emotion for this sentence, or None to keep the current one
+        """
+        if self.loop is None:
+            return
+        
+        self.loop.call_soon_threadsafe(self._start_chunk, duration, emotion)
+    
+    def _start_chunk(self, duration, emotion):
+        """Runs on the event loop: hand lip-sync over to the new chunk and show its emotion"""
+        # Only one lip-sync loop may drive MouthOpen at a time. Safe to cancel:
+        # an in-flight request still completes (see _request)
+        if self.mouth_task and not self.mouth_task.done():
+            self.mouth_task.cancel()
+        self.mouth_task = self.loop.create_task(self._talk_for(duration))
+        
+        if emotion:
+            self.loop.create_task(self.set_emotion(emotion))
+    
+    async def _talk_for(self, duration):
+        """Lip-sync one spoken chunk, reconnecting first if needed"""
+        if not self.connected and not self.reconnecting:
+            await self.reconnect()
+        
+        if self.connected:
+            await self.animate_mouth(duration)
+    
+    async def set_emotion(self, emotion):
+        """
+        Show an emotion using the expression or hotkey mapped in Config.EMOTION_EXPRESSIONS
+        
+        Args:
+            emotion: Emotion name from EmotionEngine, or None for neutral
+        """
+        if not self.connected or not Config.EXPRESSIONS_ENABLED:
+            return
+        
+        try:
+            async with self.emotion_lock:
+                await self._swap_emotion(emotion)
+        except Exception as e:
+            print(f"[VTUBER] Error setting expression: {e}")
+            self.connected = False
+            await self.reconnect()
+    
+    async def _swap_emotion(self, emotion):
+        """Turn off whatever is showing and show the new emotion (caller holds emotion_lock)"""
+        if emotion == self.current_emotion:
+            return
+        
+        name = Config.EMOTION_EXPRESSIONS.get(emotion, emotion) if emotion else None
+        key = name.lower() if name else None
+        
+        if key in self.expressions:
+            await self._set_hotkey(None)
+            await self._set_expression(self.expressions[key])
+        elif key in self.hotkeys:
+            hotkey_id, hotkey_type = self.hotkeys[key]
+            await self._set_expression(None)
+            if hotkey_type == 'ToggleExpression':
+                await self._set_hotkey(hotkey_id)
+            else:
+                # Animations and other one-shot actions fire once and are never "turned off"
+                await self._set_hotkey(None)
+                await self._request(self.vts.vts_request.requestTriggerHotKey(hotkey_id))
+        else:
+            # Neutral, or nothing on the model for this emotion
+            await self._set_expression(None)
+            await self._set_hotkey(None)
+        
+        self.current_emotion = emotion
+    
+    async def _set_expression(self, expression_file):
+        """Swap the active expression (None just clears the current one)"""
+        if expression_file == self.active_expression:
+            return
+        
+        if self.active_expression:
+            await self._request(self.vts.vts_request.BaseRequest(
+                "ExpressionActivationRequest",
+                {"expressionFile": self.active_expression, "active": False, "fadeTime": Config.EXPRESSION_FADE}
+            ))
+            self.active_expression = None
+        
+        if expression_file:
+            await self._request(self.vts.vts_request.BaseRequest(
+                "ExpressionActivationRequest",
+                {"expressionFile": expression_file, "active": True, "fadeTime": Config.EXPRESSION_FADE}
+            ))
+            self.active_expression = expression_file
+    
+    async def _set_hotkey(self, hotkey_id):
+        """
+        Swap the active ToggleExpression hotkey (None just clears the current one).
+        These hotkeys toggle, so the active one is triggered again to turn it off.
+        """
+        if hotkey_id == self.active_hotkey:
+            return
+        
+        if self.active_hotkey:
+            await self._request(self.vts.vts_request.requestTriggerHotKey(self.active_hotkey))
+            self.active_hotkey = None
+        
+        if hotkey_id:
+            await self._request(self.vts.vts_request.requestTriggerHotKey(hotkey_id))
+            self.active_hotkey = hotkey_id
+    
+    async def perform_emotions(self, tags):
+        """
+        Switch expressions sentence by sentence while the response is spoken.
+        Meant to run as a background task next to simulate_talking().
+        
+        Args:
+            tags: List of (sentence, emotion) tuples from EmotionEngine.tag()
+        """
+        if not self.connected or not tags:
+            return
+        
+        for sentence, emotion in tags:
+            # Neutral sentences keep the previous expression
+            if emotion:
+                await self.set_emotion(emotion)
+            
+            # Same speaking estimate as simulate_talking (2.5 words per second)
+            await asyncio.sleep(len(sentence.split()) / 2.5)
+        
+        # Back to neutral once the response is done
+        await self.set_emotion(None)
+    
     """Disconnect from VTube Studio"""
     async def disconnect(self):
         if self.vts:
@@ -0,0 +1,35 @@
+"""
+EmotionEngine tests - lexicon and rule-based tagging
+"""
+
+from src.emotion_engine import EmotionEngine
+
+def test_plain_questions_stay_neutral():
+    engine = EmotionEngine()
+    assert engine.detect("What do you want?") is None
+    assert engine.detect("Really? Wait, yes, I miss it.") is None
+    assert engine.detect("Hello chat.") is None
+
+def test_lexicon_words_pick_strongest_emotion():
+    engine = EmotionEngine()
+    assert engine.detect("Ooh, a shiny treasure") == 'excited'
+    assert engine.detect("A ghost? That is so creepy") == 'scared'
+    assert engine.detect("Obviously I am a mighty deity") == 'smug'
+
+def test_rules_add_weight():
+    engine = EmotionEngine()
+    assert engine.detect("You did it :)") == 'happy'
+    assert engine.detect("You did WHAT?!") == 'surprised'
+
+def test_tag_returns_one_emotion_per_sentence():
+    tags = EmotionEngine().tag("Ugh, rude mortals! Anyway, I love cats. Bye.")
+    assert tags == [
+        ("Ugh, rude mortals!", 'angry'),
+        ("Anyway, I love cats.", 'happy'),
+        ("Bye.", None),
+    ]
+
+def test_custom_lexicon():
+    engine = EmotionEngine(lexicon={'sleepy': {'yawn'}}, rules=[])
+    assert engine.detect("*yawn*") == 'sleepy'
+    assert engine.detect("Ooh, shiny") is None
@@ -0,0 +1,57 @@
+"""
+GenerationPolicy tests - tier thresholds driven by queue depth and arrival rate
+"""
+
+from src.config import Config
+from src.generation_policy import GenerationPolicy
+
+def make_policy(monkeypatch):
+    monkeypatch.setattr(Config, 'LOAD_WINDOW', 60)
+    monkeypatch.setattr(Config, 'LOAD_QUEUE_HIGH', 10)
+    monkeypatch.setattr(Config, 'LOAD_RATE_HIGH', 20)
+    return GenerationPolicy()
+
+def test_tiers_follow_queue_depth(monkeypatch):
+    policy = make_policy(monkeypatch)
+    assert policy.decide(0, now=0)['tier'] == 'calm'
+    assert policy.decide(2, now=0)['tier'] == 'calm'
+    assert policy.decide(3, now=0)['tier'] == 'busy'   # Pressure 0.3
+    assert policy.decide(6, now=0)['tier'] == 'busy'
+    assert policy.decide(7, now=0)['tier'] == 'raid'   # Pressure 0.7
+    assert policy.decide(50, now=0)['pressure'] == 1.0
+
+def test_decision_carries_tier_settings(monkeypatch):
+    policy = make_policy(monkeypatch)
+    calm, raid = Config.GENERATION_TIERS[0], Config.GENERATION_TIERS[-1]
+
+    decision = policy.decide(0, now=0)
+    assert (decision['model'], decision['max_tokens'], decision['brevity']) == (
+        calm['model'], calm['max_tokens'], calm['brevity'])
+
+    decision = policy.decide(10, now=0)
+    assert (decision['model'], decision['max_tokens'], decision['brevity']) == (
+        raid['model'], raid['max_tokens'], raid['brevity'])
+
+def test_arrival_rate_alone_raises_pressure(monkeypatch):
+    policy = make_policy(monkeypatch)
+    for second in range(15):  # 15 messages in the last minute = 0.75 pressure
+        policy.record_arrival(now=100 + second)
+
+    assert policy.arrival_rate(now=115) == 15
+    assert policy.decide(0, now=115)['tier'] == 'raid'
+
+    # Once the window has passed the rate drops back to calm
+    assert policy.decide(0, now=200)['tier'] == 'calm'
+
+def test_metrics_use_given_clock(monkeypatch):
+    policy = make_policy(monkeypatch)
+    policy.record_arrival(now=1000)
+    policy.decide(0, now=1000)
+    policy.decide(10, now=1000)
+
+    metrics = policy.get_metrics(now=1000)
+    assert metrics['arrival_rate'] == 1
+    assert metrics['decisions'] == 2
+    assert metrics['tier_counts'] == {'calm': 1, 'busy': 0, 'raid': 1}
+    assert metrics['avg_max_tokens'] == (300 + 60) / 2
+    assert metrics['last_decision']['tier'] == 'raid'
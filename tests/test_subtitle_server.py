@@ -0,0 +1,99 @@
+"""
+Headless subtitle tests - null TTS backend feeding SubtitleServer over a real WebSocket
+"""
+
+import asyncio
+import socket
+import aiohttp
+from src.config import Config
+from src.tts_engine import TTSEngine
+from src.subtitle_server import SubtitleServer
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def make_pipeline(monkeypatch):
+    monkeypatch.setattr(Config, 'TTS_ENABLED', True)
+    monkeypatch.setattr(Config, 'TTS_BACKEND', 'null')
+    monkeypatch.setattr(Config, 'TTS_RATE', 6000)  # 10ms per word keeps the test fast
+    monkeypatch.setattr(Config, 'SUBTITLES_ENABLED', True)
+    monkeypatch.setattr(Config, 'SUBTITLE_HOST', '127.0.0.1')
+    monkeypatch.setattr(Config, 'SUBTITLE_PORT', free_port())
+
+    tts = TTSEngine()
+    subtitles = SubtitleServer()
+    tts.add_listener(subtitles.on_speech)
+    return tts, subtitles
+
+async def receive_until_ends(ws, count):
+    messages = []
+    while sum(msg['type'] == 'end' for msg in messages) < count:
+        messages.append(await ws.receive_json(timeout=5))
+    return messages
+
+def test_page_is_served(monkeypatch):
+    tts, subtitles = make_pipeline(monkeypatch)
+
+    async def run():
+        await subtitles.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f'http://127.0.0.1:{subtitles.port}/') as response:
+                    return response.status, await response.text()
+        finally:
+            await subtitles.stop()
+
+    status, page = asyncio.run(run())
+    assert status == 200
+    assert 'new WebSocket' in page
+    assert 'HOLD_MS' not in page and 'MAX_WORDS' not in page
+
+def test_word_deltas_follow_speech_in_order(monkeypatch):
+    tts, subtitles = make_pipeline(monkeypatch)
+
+    async def run():
+        await subtitles.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.ws_connect(f'http://127.0.0.1:{subtitles.port}/ws') as ws:
+                    await asyncio.sleep(0.05)  # Let the server register the client
+                    tts.speak("Hello shiny chat")
+                    tts.speak("Second reply")
+                    return await receive_until_ends(ws, 2)
+        finally:
+            await subtitles.stop()
+
+    messages = asyncio.run(run())
+    assert messages == [
+        {'type': 'start', 'id': 1},
+        {'type': 'word', 'id': 1, 'word': 'Hello'},
+        {'type': 'word', 'id': 1, 'word': 'shiny'},
+        {'type': 'word', 'id': 1, 'word': 'chat'},
+        {'type': 'end', 'id': 1},
+        {'type': 'start', 'id': 2},
+        {'type': 'word', 'id': 2, 'word': 'Second'},
+        {'type': 'word', 'id': 2, 'word': 'reply'},
+        {'type': 'end', 'id': 2},
+    ]
+
+def test_late_client_gets_current_sentence_only(monkeypatch):
+    _, subtitles = make_pipeline(monkeypatch)
+
+    async def run():
+        await subtitles.start()
+        try:
+            # Speech is partway into its second sentence before the browser source connects
+            subtitles.on_speech('start', "Hi. I am Mei")
+            for word in ["Hi.", "I", "am"]:
+                subtitles.on_speech('word', word)
+            await asyncio.sleep(0.05)  # Let the loop apply the events
+
+            async with aiohttp.ClientSession() as session:
+                async with session.ws_connect(f'http://127.0.0.1:{subtitles.port}/ws') as ws:
+                    return await ws.receive_json(timeout=5)
+        finally:
+            await subtitles.stop()
+
+    assert asyncio.run(run()) == {'type': 'start', 'id': 1, 'words': ["I", "am"]}
@@ -0,0 +1,19 @@
+"""
+Text utility tests - sentence splitting used for chunked TTS and emotion tags
+"""
+
+from src.text_utils import split_sentences
+
+def test_splits_on_sentence_punctuation():
+    assert split_sentences("Hello chat. I found a shiny thing! Want it?") == [
+        "Hello chat.", "I found a shiny thing!", "Want it?",
+    ]
+
+def test_keeps_decimals_links_and_abbreviations_together():
+    assert split_sentences("Pi is about 3.14... e.g. this one. Visit twitch.tv/mei now!") == [
+        "Pi is about 3.14... e.g. this one.", "Visit twitch.tv/mei now!",
+    ]
+
+def test_text_without_punctuation_is_one_sentence():
+    assert split_sentences("  just vibing  ") == ["just vibing"]
+    assert split_sentences("") == []
@@ -0,0 +1,65 @@
+"""
+TTSEngine tests - null backend, no audio device needed
+"""
+
+import threading
+import time
+from src.config import Config
+from src.tts_engine import TTSEngine
+
+def make_engine(monkeypatch, chunked):
+    monkeypatch.setattr(Config, 'TTS_ENABLED', True)
+    monkeypatch.setattr(Config, 'TTS_BACKEND', 'null')
+    monkeypatch.setattr(Config, 'TTS_RATE', 6000)  # 10ms per word keeps the test fast
+    monkeypatch.setattr(Config, 'TTS_CHUNKED', chunked)
+    return TTSEngine()
+
+def test_chunked_mode_reports_each_sentence(monkeypatch):
+    tts = make_engine(monkeypatch, chunked=True)
+    events, chunks = [], []
+    tts.add_listener(lambda event, data: events.append((event, data)))
+
+    finished = tts.speak("Hello chat. Pi is 3.14, obviously!", on_chunk=lambda *chunk: chunks.append(chunk))
+    assert finished.wait(5)
+
+    assert [(index, sentence) for index, sentence, _ in chunks] == [
+        (0, "Hello chat."), (1, "Pi is 3.14, obviously!"),
+    ]
+    assert all(duration > 0 for _, _, duration in chunks)
+    assert events == [
+        ('start', "Hello chat. Pi is 3.14, obviously!"),
+        ('word', "Hello"), ('word', "chat."),
+        ('word', "Pi"), ('word', "is"), ('word', "3.14,"), ('word', "obviously!"),
+        ('end', "Hello chat. Pi is 3.14, obviously!"),
+    ]
+
+def test_replies_play_in_order(monkeypatch):
+    tts = make_engine(monkeypatch, chunked=False)
+    starts = []
+    tts.add_listener(lambda event, data: event == 'start' and starts.append(data))
+
+    done = [tts.speak(f"reply {n}") for n in range(5)]
+    assert all(event.wait(5) for event in done)
+    assert starts == [f"reply {n}" for n in range(5)]
+
+def test_stuck_worker_is_replaced(monkeypatch):
+    tts = make_engine(monkeypatch, chunked=False)
+    release = threading.Event()
+    spoken = []
+
+    def speak_null(text):
+        if text == "hang":
+            release.wait(5)  # Simulates pyttsx3 stuck in runAndWait
+        spoken.append(text)
+
+    monkeypatch.setattr(tts, '_speak_null', speak_null)
+    monkeypatch.setattr(tts, 'playback_timeout', lambda text: 0.05)
+
+    stuck = tts.speak("hang")
+    time.sleep(0.1)  # Past the deadline
+    after = tts.speak("next reply")
+
+    assert after.wait(2)
+    assert not stuck.is_set()
+    assert spoken == ["next reply"]
+    release.set()
@@ -0,0 +1,116 @@
+"""
+VTuberController expression tests - fake VTube Studio connection, no app needed
+"""
+
+import asyncio
+from src.config import Config
+from src.vtuber_controller import VTuberController
+
+class FakeRequests:
+    def BaseRequest(self, message_type, data=None):
+        return {"messageType": message_type, "data": data}
+
+    def requestHotKeyList(self):
+        return self.BaseRequest("HotkeysInCurrentModelRequest")
+
+    def requestTriggerHotKey(self, hotkeyID):
+        return self.BaseRequest("HotkeyTriggerRequest", {"hotkeyID": hotkeyID})
+
+class FakeVTS:
+    """Answers like VTube Studio after a small delay, and records every request"""
+
+    def __init__(self):
+        self.vts_request = FakeRequests()
+        self.sent = []
+        self.active = set()  # Expression files currently switched on
+
+    async def request(self, message):
+        await asyncio.sleep(0.02)
+        self.sent.append(message)
+        message_type, data = message["messageType"], message["data"]
+
+        if message_type == "HotkeysInCurrentModelRequest":
+            return {"data": {"availableHotkeys": [
+                {"name": "Angry", "hotkeyID": "toggle-angry", "type": "ToggleExpression"},
+                {"name": "Surprised", "hotkeyID": "anim-jump", "type": "TriggerAnimation"},
+            ]}}
+        if message_type == "ExpressionStateRequest":
+            return {"data": {"expressions": [
+                {"name": "Smile", "file": "Smile.exp3.json"},
+                {"name": "Excited", "file": "Excited.exp3.json"},
+            ]}}
+        if message_type == "ExpressionActivationRequest":
+            if data["active"]:
+                self.active.add(data["expressionFile"])
+            else:
+                self.active.discard(data["expressionFile"])
+        return {"data": {}}
+
+    def triggered(self):
+        return [m["data"]["hotkeyID"] for m in self.sent if m["messageType"] == "HotkeyTriggerRequest"]
+
+def run_with_controller(monkeypatch, scenario):
+    monkeypatch.setattr(Config, 'EXPRESSIONS_ENABLED', True)
+
+    async def run():
+        controller = VTuberController()
+        controller.vts = FakeVTS()
+        controller.connected = True
+        await controller._load_model_actions()
+        await scenario(controller)
+        return controller
+
+    return asyncio.run(run())
+
+def test_hotkey_types_are_cached(monkeypatch):
+    async def scenario(controller):
+        pass
+
+    controller = run_with_controller(monkeypatch, scenario)
+    assert controller.hotkeys == {
+        'angry': ("toggle-angry", "ToggleExpression"),
+        'surprised': ("anim-jump", "TriggerAnimation"),
+    }
+
+def test_overlapping_emotion_changes_leave_one_expression(monkeypatch):
+    states = []
+
+    async def scenario(controller):
+        await asyncio.gather(controller.set_emotion('happy'), controller.set_emotion('excited'))
+        states.append(set(controller.vts.active))
+        await controller.set_emotion(None)
+        states.append(set(controller.vts.active))
+
+    run_with_controller(monkeypatch, scenario)
+    assert states == [{"Excited.exp3.json"}, set()]
+
+def test_toggle_hotkey_is_triggered_again_to_clear(monkeypatch):
+    async def scenario(controller):
+        await controller.set_emotion('angry')
+        await controller.set_emotion(None)
+
+    controller = run_with_controller(monkeypatch, scenario)
+    assert controller.vts.triggered() == ["toggle-angry", "toggle-angry"]
+    assert controller.active_hotkey is None
+
+def test_one_shot_hotkey_fires_once(monkeypatch):
+    async def scenario(controller):
+        await controller.set_emotion('surprised')
+        await controller.set_emotion('happy')
+        await controller.set_emotion(None)
+
+    controller = run_with_controller(monkeypatch, scenario)
+    assert controller.vts.triggered() == ["anim-jump"]
+    assert controller.active_hotkey is None
+
+def test_cancelled_caller_does_not_cut_a_request_in_half(monkeypatch):
+    async def scenario(controller):
+        request = controller.vts.vts_request.requestTriggerHotKey("anim-jump")
+        task = asyncio.create_task(controller._request(request))
+        await asyncio.sleep(0.005)  # Request is in flight
+        task.cancel()
+        await asyncio.sleep(0.05)
+
+    controller = run_with_controller(monkeypatch, scenario)
+    assert controller.vts.triggered() == ["anim-jump"]
+    assert not controller.request_lock.locked()